@@ -1,11 +1,48 @@
 # analyzer.py
 
+from dataclasses import dataclass
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 from scipy import stats
 import statsmodels.api as sm
 
 
+@dataclass
+class LinearFit:
+    """
+    Result of a simple linear regression y = params[0] + params[1]·x.
+
+    params, bse, tvalues, pvalues are (intercept, slope) arrays.
+    results holds the full statsmodels fit when it was requested (verbose=True);
+    xname/yname label its summary table.
+    """
+    params: np.ndarray
+    bse: np.ndarray
+    tvalues: np.ndarray
+    pvalues: np.ndarray
+    rsquared: float
+    nobs: int
+    results: Optional[sm.regression.linear_model.RegressionResultsWrapper] = None
+    xname: str = "x"
+    yname: str = "y"
+
+    def predict(self, x) -> np.ndarray:
+        """
+        Returns params[0] + params[1]·x for the given x values.
+        """
+        return self.params[0] + self.params[1] * np.asarray(x, dtype=np.float64)
+
+    def summary(self):
+        """
+        Returns the statsmodels summary table (only available with verbose=True).
+        """
+        if self.results is None:
+            raise ValueError("Full summary is only available for fits made with verbose=True")
+        return self.results.summary(yname=self.yname, xname=["const", self.xname])
+
+
 class Analyzer:
     """
     Performs statistical analyses: correlation, regression, trend tests.
@@ -21,45 +58,149 @@ class Analyzer:
 
         The returned DataFrame has columns: [country, year, life_expectancy, gdp_per_capita].
         """
-        df_2020 = df[df["year"] == 2020].copy()
-        df_2020 = df_2020[(df_2020["gdp_per_capita"] > 0) & (df_2020["life_expectancy"] > 0)]
-        df_2020 = df_2020[df_2020["life_expectancy"] > 10]
-        df_2020 = df_2020[df_2020["gdp_per_capita"] < 1e6]
-        return df_2020
+        mask = (
+            (df["year"] == 2020)
+            & (df["gdp_per_capita"] > 0)
+            & (df["life_expectancy"] > 10)
+            & (df["gdp_per_capita"] < 1e6)
+        )
+        columns = ["country", "year", "life_expectancy", "gdp_per_capita"]
+        return df.loc[mask, columns].reset_index(drop=True)
 
     @staticmethod
     def compute_pearson(df: pd.DataFrame) -> tuple[float, float]:
         """
         Return (r, p) = Pearson correlation between gdp_per_capita and life_expectancy
         on the provided DataFrame (un‐logged).
+
+        Computed from the raw sums in one pass; the two‐sided p‐value comes from
+        t = r·sqrt((n−2)/(1−r²)) with n−2 degrees of freedom (same as scipy's pearsonr,
+        including its edge cases: ValueError for n < 2, p = 1 for n == 2).
         """
-        r, p = stats.pearsonr(df["gdp_per_capita"], df["life_expectancy"])
-        return r, p
+        x = df["gdp_per_capita"].to_numpy(np.float64, copy=False)
+        y = df["life_expectancy"].to_numpy(np.float64, copy=False)
+        n = x.size
+        if n < 2:
+            raise ValueError(f"Pearson correlation needs at least 2 observations, got {n}")
+        sx, sy = x.sum(), y.sum()
+        sxx, syy, sxy = np.dot(x, x), np.dot(y, y), np.dot(x, y)
+        r = (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+        r = float(np.clip(r, -1.0, 1.0))
+        if n == 2:
+            # Two points always lie on a line: r = ±1 carries no evidence
+            return r, 1.0
+        if abs(r) == 1.0:
+            return r, 0.0
+        t = r * np.sqrt((n - 2) / (1.0 - r * r))
+        p = 2 * stats.t.sf(abs(t), n - 2)
+        return r, float(p)
 
     @staticmethod
-    def regression_log_gdp(df: pd.DataFrame) -> sm.regression.linear_model.RegressionResultsWrapper:
+    def _fast_ols(x: np.ndarray, y: np.ndarray) -> LinearFit:
         """
-        Fit OLS: life_expectancy ~ log10(gdp_per_capita) on df.
-        Returns the fitted model object.
+        Fit y = b0 + b1·x by solving the 2×2 normal equations in closed form.
+        Standard errors, t‐statistics and p‐values match statsmodels' OLS.
+
+        Raises ValueError for fewer than 3 observations or a constant x.
         """
-        df["log_gdp"] = np.log10(df["gdp_per_capita"])
-        X = sm.add_constant(df["log_gdp"])
-        y = df["life_expectancy"]
-        model = sm.OLS(y, X).fit()
-        return model
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n = x.size
+        if n < 3:
+            raise ValueError(f"OLS needs at least 3 observations, got {n}")
+        x_mean, y_mean = x.mean(), y.mean()
+        dx, dy = x - x_mean, y - y_mean
+        sxx, sxy, syy = np.dot(dx, dx), np.dot(dx, dy), np.dot(dy, dy)
+        if sxx == 0:
+            raise ValueError("OLS needs x to vary; all x values are equal")
+
+        beta1 = sxy / sxx
+        beta0 = y_mean - beta1 * x_mean
+        resid = dy - beta1 * dx
+        sse = np.dot(resid, resid)
+        s2 = sse / (n - 2)
+
+        params = np.array([beta0, beta1])
+        bse = np.sqrt(s2 * np.array([1.0 / n + x_mean * x_mean / sxx, 1.0 / sxx]))
+        tvalues = params / bse
+        pvalues = 2 * stats.t.sf(np.abs(tvalues), n - 2)
+        return LinearFit(
+            params=params,
+            bse=bse,
+            tvalues=tvalues,
+            pvalues=pvalues,
+            rsquared=float(1.0 - sse / syy),
+            nobs=n
+        )
 
     @staticmethod
-    def trend_czech(df: pd.DataFrame) -> tuple[pd.DataFrame, sm.regression.linear_model.RegressionResultsWrapper]:
+    def _full_ols(x: np.ndarray, y: np.ndarray) -> sm.regression.linear_model.RegressionResultsWrapper:
+        """
+        Fit y ~ 1 + x with statsmodels from a plain [1, x] design array
+        (for the full results / summary table).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        X = np.column_stack([np.ones_like(x), x])
+        return sm.OLS(np.asarray(y, dtype=np.float64), X).fit()
+
+    @classmethod
+    def regression_log_gdp(cls, df: pd.DataFrame, verbose: bool = False) -> LinearFit:
+        """
+        Fit OLS: life_expectancy ~ log10(gdp_per_capita) on df (df is not modified).
+        Returns the fitted LinearFit, with params[0] = intercept and params[1] = slope
+        on log10(GDP); with verbose=True it also carries the full statsmodels
+        results (for .summary()).
+        """
+        log_gdp = np.log10(df["gdp_per_capita"].to_numpy(np.float64, copy=False))
+        y = df["life_expectancy"].to_numpy(np.float64, copy=False)
+        fit = cls._fast_ols(log_gdp, y)
+        fit.xname, fit.yname = "log_gdp", "life_expectancy"
+        if verbose:
+            fit.results = cls._full_ols(log_gdp, y)
+        return fit
+
+    @classmethod
+    def trend_czech(cls, df: pd.DataFrame, verbose: bool = False) -> tuple[pd.DataFrame, LinearFit]:
         """
         Filter df to (country == "Czech Republic" AND year in [2000..2020]),
         fit OLS: life_expectancy ~ year.
-        Returns the filtered Czech time‐series DataFrame and the fitted model.
+        Returns the filtered Czech time‐series DataFrame and the fitted LinearFit;
+        with verbose=True the fit also carries the full statsmodels results.
+
+        df may also be indexed by a (country, year) MultiIndex, e.g.
+        df.set_index(["country", "year"]).sort_index(); the rows are then sliced
+        from the index instead of scanning the columns (an unsorted index is
+        sorted first).
+
+        Raises ValueError if df has no Czech rows for 2000–2020.
         """
-        cz_df = df[(df["country"] == "Czech Republic") & df["year"].between(2000, 2020)].copy()
-        X = sm.add_constant(cz_df["year"])
-        y = cz_df["life_expectancy"]
-        model = sm.OLS(y, X).fit()
-        return cz_df, model
+        if list(df.index.names) == ["country", "year"]:
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            # Binary search on the sorted index; an absent country gives an empty range
+            start, stop = df.index.slice_locs(("Czech Republic", 2000), ("Czech Republic", 2020))
+            cz_df = df.iloc[start:stop].reset_index()
+        else:
+            country = df["country"]
+            if isinstance(country.dtype, pd.CategoricalDtype):
+                # Compare integer codes rather than strings
+                categories = country.cat.categories
+                if "Czech Republic" in categories:
+                    is_cz = country.cat.codes == categories.get_loc("Czech Republic")
+                else:
+                    is_cz = pd.Series(False, index=df.index)
+            else:
+                is_cz = country == "Czech Republic"
+            cz_df = df[is_cz & df["year"].between(2000, 2020)].copy()
+        if cz_df.empty:
+            raise ValueError("No Czech Republic rows for 2000–2020 in df")
+        years = cz_df["year"].to_numpy(np.float64, copy=False)
+        y = cz_df["life_expectancy"].to_numpy(np.float64, copy=False)
+        fit = cls._fast_ols(years, y)
+        fit.xname, fit.yname = "year", "life_expectancy"
+        if verbose:
+            fit.results = cls._full_ols(years, y)
+        return cz_df, fit
 
     @staticmethod
     def paired_ttest_czech(df_cz: pd.DataFrame) -> tuple[float, float]:
@@ -68,8 +209,11 @@ class Analyzer:
         compute year-over-year differences and run a one-sample t-test against μ=0.
         Returns (t_stat, p_value).
         """
-        cz_sorted = df_cz.sort_values(by="year")
-        le_vals = cz_sorted["life_expectancy"].values
-        diffs = le_vals[1:] - le_vals[:-1]
-        t_stat, p_value = stats.ttest_1samp(diffs, 0)
-        return t_stat, p_value
+        # cz_df from trend_czech is normally already in year order; only sort if not
+        if not df_cz["year"].is_monotonic_increasing:
+            df_cz = df_cz.sort_values(by="year", kind="stable")
+        diffs = np.diff(df_cz["life_expectancy"].to_numpy(np.float64, copy=False))
+        n = diffs.size
+        t_stat = diffs.mean() / (diffs.std(ddof=1) / np.sqrt(n))
+        p_value = 2 * stats.t.sf(abs(t_stat), n - 1)
+        return float(t_stat), float(p_value)
@@ -1,29 +1,115 @@
 # data_loader.py
 
+import hashlib
+import os
+from typing import Optional
+
 import pandas as pd
 
+# Bump whenever the cached tables change shape or dtypes (CSV parsing or the
+# melt/clean/merge output), so caches written by older code are not reused.
+CACHE_VERSION = 2
+
+# Expected dtypes of the cached merged table; anything else is treated as stale.
+MERGED_DTYPES = {
+    "country": "category",
+    "year": "int16",
+    "life_expectancy": "float32",
+    "gdp_per_capita": "float32",
+}
+
 
 class DataLoader:
     """
     Loads raw CSV files from disk.
+
+    Parsed tables are cached as Parquet files under cache_dir, keyed by
+    CACHE_VERSION and the source files' path, modification time and size, so
+    repeated runs skip CSV parsing until a source file (or the cache format) changes.
     """
 
-    def __init__(self, life_path: str, gdp_path: str):
+    def __init__(self, life_path: str, gdp_path: str, cache_dir: str = ".cache"):
         """
         life_path: path to the life expectancy wide‐format CSV
         gdp_path: path to the GDP per capita wide‐format CSV
+        cache_dir: folder for cached Parquet files
         """
         self.life_path = life_path
         self.gdp_path = gdp_path
+        self.cache_dir = cache_dir
+
+    def _cache_path(self, name: str, *sources: str) -> str:
+        """
+        Returns cache_dir/<name>-<hash>.parquet, where the hash covers
+        CACHE_VERSION and the path, mtime and size of every source file.
+        """
+        key = "|".join(
+            [f"v{CACHE_VERSION}"]
+            + [f"{path}:{os.path.getmtime(path)}:{os.path.getsize(path)}" for path in sources]
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.parquet")
+
+    @staticmethod
+    def _read_wide_csv(path: str, value_dtype: str) -> pd.DataFrame:
+        """
+        Parses a wide‐format CSV [country, 1800, ..., 2100] with the multi‐threaded
+        pyarrow reader, declaring every year column as value_dtype up front
+        instead of letting pandas infer it. The result is Arrow‐backed, so the
+        parsed buffers are handed over without conversion to NumPy.
+        """
+        columns = pd.read_csv(path, nrows=0).columns
+        dtype = {c: value_dtype for c in columns if c != "country"}
+        dtype["country"] = "string[pyarrow]"
+        return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow", dtype=dtype)
+
+    def _read_csv_cached(self, path: str, value_dtype: str) -> pd.DataFrame:
+        """
+        Reads path from its Parquet cache if present; otherwise parses the CSV
+        and writes the cache.
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        cache_path = self._cache_path(name, path)
+        if os.path.exists(cache_path):
+            return pd.read_parquet(cache_path, engine="pyarrow", dtype_backend="pyarrow")
+        df = self._read_wide_csv(path, value_dtype)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_parquet(cache_path, engine="pyarrow", index=False)
+        return df
 
     def load_life_expectancy(self) -> pd.DataFrame:
         """
         Returns a DataFrame of the raw (wide‐format) life expectancy data.
+        All year columns are Arrow float32.
         """
-        return pd.read_csv(self.life_path)
+        return self._read_csv_cached(self.life_path, "float32[pyarrow]")
 
     def load_gdp_per_capita(self) -> pd.DataFrame:
         """
         Returns a DataFrame of the raw (wide‐format) GDP per capita data.
+        Year columns stay strings, since values carry suffixes like "27.7k".
+        """
+        return self._read_csv_cached(self.gdp_path, "string[pyarrow]")
+
+    def load_merged_cache(self) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached merged (long‐format) DataFrame built from the current
+        source files, or None if it has not been cached yet or its columns do
+        not have the expected MERGED_DTYPES.
+        """
+        cache_path = self._cache_path("merged", self.life_path, self.gdp_path)
+        if not os.path.exists(cache_path):
+            return None
+        merged_df = pd.read_parquet(cache_path, engine="pyarrow")
+        dtypes = {col: str(dtype) for col, dtype in merged_df.dtypes.items()}
+        if dtypes != MERGED_DTYPES:
+            return None
+        return merged_df
+
+    def save_merged_cache(self, merged_df: pd.DataFrame) -> None:
+        """
+        Writes the merged DataFrame to the cache, keyed by the current source files.
         """
-        return pd.read_csv(self.gdp_path)
+        cache_path = self._cache_path("merged", self.life_path, self.gdp_path)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        merged_df.to_parquet(cache_path, engine="pyarrow", index=False)
@@ -2,6 +2,8 @@
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 class DataTransformer:
@@ -10,24 +12,45 @@ class DataTransformer:
     """
 
     @staticmethod
-    def melt_life_expectancy(life_df: pd.DataFrame) -> pd.DataFrame:
+    def _wide_to_long(wide_df: pd.DataFrame, value_name: str, value_dtype=None) -> pd.DataFrame:
+        """
+        Reshape [country, 1800, ..., 2100] into [country, year (int16), value_name]
+        straight from the underlying 2D array, skipping missing values.
+        country is returned as a categorical; values are converted to value_dtype
+        (default: let pandas pick, i.e. object for string columns).
+
+        Rows come out in the same order as DataFrame.melt (all countries for the
+        first year, then the next year, ...).
+        """
+        year_cols = [c for c in wide_df.columns if c != "country"]
+        years = np.array([int(c) for c in year_cols], dtype=np.int16)
+        # Arrow-backed columns: missing cells come out as NaN
+        values = wide_df[year_cols].to_numpy(dtype=value_dtype, na_value=np.nan)
+        n_countries, n_years = values.shape
+
+        # Column-major ravel matches melt's ordering (and pandas' block layout)
+        value_arr = values.ravel(order="F")
+        keep = pd.notna(value_arr)
+        country_arr = np.tile(wide_df["country"].to_numpy(), n_years)
+        year_arr = np.repeat(years, n_countries)
+
+        return pd.DataFrame({
+            "country": pd.Categorical(country_arr[keep]),
+            "year": year_arr[keep],
+            value_name: value_arr[keep],
+        })
+
+    @classmethod
+    def melt_life_expectancy(cls, life_df: pd.DataFrame) -> pd.DataFrame:
         """
         Convert life expectancy from wide to long format:
 
         Input wide‐format columns: [country, 1800, 1801, ..., 2100]
-        Output long‐format columns: [country, year (as int), life_expectancy]
+        Output long‐format columns: [country, year (int16), life_expectancy (float32)]
 
         Drops any missing life_expectancy.
         """
-        life_long = life_df.melt(
-            id_vars="country",
-            var_name="year",
-            value_name="life_expectancy"
-        )
-        # Convert 'year' → int, drop NaN life_expectancy
-        life_long["year"] = life_long["year"].astype(int)
-        life_long = life_long.dropna(subset=["life_expectancy"])
-        return life_long
+        return cls._wide_to_long(life_df, "life_expectancy", np.float32)
 
     @staticmethod
     def clean_gdp_cell(val) -> float:
@@ -52,26 +75,47 @@ class DataTransformer:
         except ValueError:
             return np.nan
 
+    @staticmethod
+    def _parse_gdp_strings(raw) -> np.ndarray:
+        """
+        Vectorized counterpart of clean_gdp_cell over an array of raw GDP strings,
+        using Arrow compute kernels: strip whitespace, drop a trailing 'k'/'K' and
+        commas, cast to float and scale the 'k' rows by 1000. Invalid values become NaN.
+
+        Only plain ASCII decimal numbers with an optional sign and exponent are
+        accepted (e.g. "27.7k", "5,380", "-3", "1e3"). Inputs that Python's float()
+        also takes, such as "inf", "nan", "1_000" or non-ASCII digits, become NaN
+        here, while clean_gdp_cell parses them.
+        """
+        s = pc.utf8_trim_whitespace(pa.array(raw, type=pa.string(), from_pandas=True))
+        mask_k = pc.fill_null(pc.or_(pc.ends_with(s, "k"), pc.ends_with(s, "K")), False)
+        num = pc.if_else(mask_k, pc.utf8_slice_codeunits(s, 0, -1), s)
+        num = pc.utf8_trim_whitespace(pc.replace_substring(num, ",", ""))
+        # pc.cast has no errors="coerce": null out anything that is not a plain number
+        valid = pc.match_substring_regex(num, r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+        vals = pc.cast(pc.if_else(valid, num, pa.scalar(None, pa.string())), pa.float64())
+        vals = pc.if_else(mask_k, pc.multiply(vals, 1000.0), vals)
+        return vals.to_numpy(zero_copy_only=False)
+
     @classmethod
     def melt_gdp_per_capita(cls, gdp_df: pd.DataFrame) -> pd.DataFrame:
         """
         Convert GDP per capita from wide to long format:
 
         Input wide‐format columns: [country, 1800, 1801, ..., 2100]
-        Output columns: [country, year (int), gdp_per_capita_raw, gdp_per_capita (float)]
+        Output columns: [country, year (int16), gdp_per_capita (float32)]
 
-        It uses clean_gdp_cell to parse "27.7k" → 27700. Drops NaN in gdp_per_capita.
+        Parses "27.7k" → 27700 with Arrow compute kernels (see _parse_gdp_strings;
+        agrees with clean_gdp_cell on plain decimal values). Drops NaN in gdp_per_capita.
         """
-        gdp_melted = gdp_df.melt(
-            id_vars="country",
-            var_name="year",
-            value_name="gdp_per_capita_raw"
-        )
-        # Convert 'year' → int
-        gdp_melted["year"] = gdp_melted["year"].astype(int)
+        # Reshape the raw strings first (dropping empty cells), then clean
+        gdp_melted = cls._wide_to_long(gdp_df, "gdp_per_capita_raw")
 
-        # Apply cleaning
-        gdp_melted["gdp_per_capita"] = gdp_melted["gdp_per_capita_raw"].apply(cls.clean_gdp_cell)
+        # Many cells repeat the same string, so parse each distinct string once
+        # and map the results back by code (code −1 = missing → NaN)
+        codes, uniques = pd.factorize(gdp_melted["gdp_per_capita_raw"])
+        parsed = cls._parse_gdp_strings(uniques).astype(np.float32)
+        gdp_melted["gdp_per_capita"] = np.append(parsed, np.float32(np.nan))[codes]
 
         # Drop raw column and rows where gdp_per_capita is NaN
         gdp_melted = gdp_melted.drop(columns=["gdp_per_capita_raw"]).dropna(subset=["gdp_per_capita"])
@@ -84,11 +128,20 @@ class DataTransformer:
 
         Returns a merged DataFrame with columns:
         [country, year, life_expectancy, gdp_per_capita]
+
+        Both country columns are put on the same categories first, so the join
+        hashes integer codes (plus the int16 year) instead of strings.
         """
+        cats = life_long["country"].cat.categories.union(gdp_long["country"].cat.categories)
+        life_long = life_long.assign(country=life_long["country"].cat.set_categories(cats))
+        gdp_long = gdp_long.assign(country=gdp_long["country"].cat.set_categories(cats))
+        # sort=False spells out the default: keep the left frame's row order
         merged = pd.merge(
             life_long,
             gdp_long,
             on=["country", "year"],
-            how="inner"
+            how="inner",
+            sort=False
         )
         return merged
+
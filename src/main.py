@@ -1,6 +1,7 @@
 # main.py
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from data_loader import DataLoader
 from data_transformer import DataTransformer
 from analyzer import Analyzer
@@ -16,18 +17,30 @@ def main():
         life_path="data/lex.csv",
         gdp_path="data/gdp_pcap.csv"
     )
-    life_raw = loader.load_life_expectancy()
-    gdp_raw = loader.load_gdp_per_capita()
 
-    # Transform data (melt + clean + merge)
-    transformer = DataTransformer()
-    life_long = transformer.melt_life_expectancy(life_raw)
-    gdp_long = transformer.melt_gdp_per_capita(gdp_raw)
-    merged_df = transformer.merge_datasets(life_long, gdp_long)
+    # Reuse the merged table from a previous run if the CSVs are unchanged
+    merged_df = loader.load_merged_cache()
+    if merged_df is None:
+        # Load + transform both datasets concurrently (CSV parsing and the
+        # NumPy/pandas kernels release the GIL), then merge
+        transformer = DataTransformer()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            life_future = executor.submit(
+                lambda: transformer.melt_life_expectancy(loader.load_life_expectancy())
+            )
+            gdp_future = executor.submit(
+                lambda: transformer.melt_gdp_per_capita(loader.load_gdp_per_capita())
+            )
+            life_long = life_future.result()
+            gdp_long = gdp_future.result()
+        merged_df = transformer.merge_datasets(life_long, gdp_long)
+        loader.save_merged_cache(merged_df)
 
     # (Optional) Print merged DataFrame head for verification
     print("\nMerged DataFrame (first 5 rows):")
-    print(merged_df.head())
+    # Values are stored as float32; widen and round so the print shows e.g. 28.2
+    # rather than float32 artefacts like 28.200001
+    print(merged_df.head().astype({"life_expectancy": float, "gdp_per_capita": float}).round(2))
 
     # Analyze year 2020
     analyzer = Analyzer()
@@ -60,7 +73,7 @@ def main():
     )
 
     # Czech Republic trend (2000–2020)
-    cz_df, trend_model = analyzer.trend_czech(merged_df)
+    cz_df, trend_model = analyzer.trend_czech(merged_df, verbose=True)
     print("\nCzech Republic Trend Regression (2000–2020):")
     print(trend_model.summary())
 
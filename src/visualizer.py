@@ -1,10 +1,20 @@
 # visualizer.py
 
 import os
+from typing import Optional
+
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import statsmodels.api as sm
+import matplotlib
+
+matplotlib.use("Agg")  # non-interactive backend: plots are only saved to files
+import matplotlib.pyplot as plt  # noqa: E402
+
+from analyzer import LinearFit
+
+# Output resolution and zlib level for saved PNGs (lower level = faster encoding)
+SAVE_DPI = 150
+PNG_COMPRESS_LEVEL = 1
 
 
 class Visualizer:
@@ -19,16 +29,17 @@ class Visualizer:
     def plot_scatter_log(
         self,
         df: pd.DataFrame,
-        highlight_countries: dict[str, str],
+        highlight_countries: Optional[dict[str, str]],
         filename: str = "scatter_2020.png"
     ) -> None:
         """
         Scatter: life_expectancy vs. gdp_per_capita (log scale on x) for df (year=2020).
-        highlight_countries: dict mapping country→color (if empty, all points are 'other countries').
+        highlight_countries: dict mapping country→color (if empty or None, all points are 'other countries').
         Saves to results_dir/filename.
         """
-        # “Others” = all rows not in highlight_countries
-        others = df[~df["country"].isin(highlight_countries.keys())]
+        # “Others” = all rows not in highlight_countries (no mask needed if empty)
+        highlight_countries = highlight_countries or {}
+        others = df[~df["country"].isin(tuple(highlight_countries))] if highlight_countries else df
         plt.figure(figsize=(8, 6))
 
         # Plot “others” in light gray
@@ -38,6 +49,7 @@ class Visualizer:
             alpha=0.7,
             color="lightgray",
             edgecolor="none",
+            rasterized=True,
             label="Countries (2020)"
         )
 
@@ -64,22 +76,23 @@ class Visualizer:
         plt.tight_layout()
 
         save_path = os.path.join(self.results_dir, filename)
-        plt.savefig(save_path, dpi=300)
+        plt.savefig(save_path, dpi=SAVE_DPI, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
         plt.close()
 
     def plot_regression_log(
         self,
         df: pd.DataFrame,
-        model: sm.regression.linear_model.RegressionResultsWrapper,
-        highlight_countries: dict[str, str],
+        model: LinearFit,
+        highlight_countries: Optional[dict[str, str]],
         filename: str = "regression_2020.png"
     ) -> None:
         """
         Scatter + regression line for life_expectancy ~ log₁₀(gdp_per_capita) in df (year=2020).
-        highlight_countries: dict mapping country→color (if empty, all points are 'other countries').
+        highlight_countries: dict mapping country→color (if empty or None, all points are 'other countries').
         Saves to results_dir/filename.
         """
-        others = df[~df["country"].isin(highlight_countries.keys())]
+        highlight_countries = highlight_countries or {}
+        others = df[~df["country"].isin(tuple(highlight_countries))] if highlight_countries else df
         plt.figure(figsize=(8, 6))
 
         # “Other” countries in light gray
@@ -89,6 +102,7 @@ class Visualizer:
             alpha=0.7,
             color="lightgray",
             edgecolor="none",
+            rasterized=True,
             label="Countries (2020)"
         )
 
@@ -106,14 +120,15 @@ class Visualizer:
                     label=country
                 )
 
-        # Regression line (fit on log₁₀(GDP))
-        gdp_vals = np.logspace(
+        # Regression line (fit on log₁₀(GDP)): build the grid in log space so the
+        # prediction needs no log10 round trip
+        log_vals = np.linspace(
             np.log10(df["gdp_per_capita"].min()),
             np.log10(df["gdp_per_capita"].max()),
             200
         )
-        log_vals = np.log10(gdp_vals)
-        predicted = model.predict(sm.add_constant(log_vals))
+        gdp_vals = 10.0 ** log_vals
+        predicted = model.params[0] + model.params[1] * log_vals
 
         plt.plot(
             gdp_vals,
@@ -132,13 +147,13 @@ class Visualizer:
         plt.tight_layout()
 
         save_path = os.path.join(self.results_dir, filename)
-        plt.savefig(save_path, dpi=300)
+        plt.savefig(save_path, dpi=SAVE_DPI, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
         plt.close()
 
     def plot_czech_trend(
         self,
         cz_df: pd.DataFrame,
-        model: sm.regression.linear_model.RegressionResultsWrapper,
+        model: LinearFit,
         filename: str = "lex_trend_czech.png"
     ) -> None:
         """
@@ -154,12 +169,13 @@ class Visualizer:
             color="blue",
             edgecolor="k",
             s=50,
+            rasterized=True,
             label="Czech Republic"
         )
 
         # Trend line: predict for years [2000, 2020]
         years_range = np.array([2000, 2020])
-        pred = model.predict(sm.add_constant(years_range))
+        pred = model.predict(years_range)
 
         plt.plot(
             years_range,
@@ -177,5 +193,5 @@ class Visualizer:
         plt.tight_layout()
 
         save_path = os.path.join(self.results_dir, filename)
-        plt.savefig(save_path, dpi=300)
+        plt.savefig(save_path, dpi=SAVE_DPI, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
         plt.close()
@@ -0,0 +1,114 @@
+# test_analyzer.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from analyzer import Analyzer  # noqa: E402
+
+
+def _merged_frame() -> pd.DataFrame:
+    """
+    Small merged-style frame: two countries, years 1995–2022, Czech life
+    expectancy rising linearly with a little noise.
+    """
+    rng = np.random.default_rng(0)
+    years = np.arange(1995, 2023)
+    rows = []
+    for country, base in [("Albania", 70.0), ("Czech Republic", 75.0)]:
+        life = base + 0.2 * (years - 1995) + rng.normal(0, 0.1, years.size)
+        rows.append(pd.DataFrame({
+            "country": country,
+            "year": years.astype(np.int16),
+            "life_expectancy": life.astype(np.float32),
+            "gdp_per_capita": np.float32(10000.0),
+        }))
+    df = pd.concat(rows, ignore_index=True)
+    df["country"] = df["country"].astype("category")
+    return df
+
+
+def test_trend_czech_indexed_matches_flat():
+    df = _merged_frame()
+    flat_cz, flat_fit = Analyzer.trend_czech(df)
+    indexed = df.set_index(["country", "year"])
+    for frame in (indexed, indexed.sort_index()):
+        cz_df, fit = Analyzer.trend_czech(frame)
+        assert len(cz_df) == len(flat_cz) == 21
+        np.testing.assert_allclose(fit.params, flat_fit.params)
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_trend_czech_without_czech_rows_raises(indexed):
+    df = _merged_frame()
+    df = df[df["country"] != "Czech Republic"]
+    if indexed:
+        df = df.set_index(["country", "year"]).sort_index()
+    with pytest.raises(ValueError, match="Czech Republic"):
+        Analyzer.trend_czech(df)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_fast_ols_matches_statsmodels(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(2.0, 5.0, 150)
+    y = 30.0 + 10.0 * x + rng.normal(0, 3.0, x.size)
+    fit = Analyzer._fast_ols(x, y)
+    full = Analyzer._full_ols(x, y)
+    np.testing.assert_allclose(fit.params, full.params, rtol=1e-10)
+    np.testing.assert_allclose(fit.bse, full.bse, rtol=1e-10)
+    np.testing.assert_allclose(fit.pvalues, full.pvalues, rtol=1e-8)
+    assert fit.rsquared == pytest.approx(full.rsquared, rel=1e-10)
+
+
+@pytest.mark.parametrize("x, y", [
+    ([], []),
+    ([1.0, 2.0], [3.0, 4.0]),
+    ([2.0, 2.0, 2.0, 2.0], [1.0, 2.0, 3.0, 4.0]),
+])
+def test_fast_ols_rejects_degenerate_input(x, y):
+    with pytest.raises(ValueError):
+        Analyzer._fast_ols(np.array(x), np.array(y))
+
+
+def _xy_frame(x, y) -> pd.DataFrame:
+    return pd.DataFrame({"gdp_per_capita": x, "life_expectancy": y}, dtype=np.float64)
+
+
+@pytest.mark.parametrize("x, y", [
+    ([1.0, 2.0], [5.0, 3.0]),
+    ([1.0, 2.0], [3.0, 5.0]),
+    ([1.0, 2.0, 4.0], [3.0, 1.0, 2.0]),
+])
+def test_compute_pearson_matches_scipy_small_n(x, y):
+    r, p = Analyzer.compute_pearson(_xy_frame(x, y))
+    expected = stats.pearsonr(x, y)
+    assert r == pytest.approx(expected.statistic)
+    assert p == pytest.approx(expected.pvalue, abs=1e-12)
+
+
+def test_compute_pearson_perfect_line_has_zero_p_value():
+    r, p = Analyzer.compute_pearson(_xy_frame([1.0, 2.0, 3.0], [2.0, 4.0, 6.0]))
+    assert r == pytest.approx(1.0)
+    assert p == pytest.approx(0.0, abs=1e-6)
+
+
+def test_compute_pearson_matches_scipy_random():
+    rng = np.random.default_rng(3)
+    x = rng.lognormal(9.0, 1.0, 200)
+    y = 55.0 + 3.0 * np.log(x) + rng.normal(0, 4.0, x.size)
+    r, p = Analyzer.compute_pearson(_xy_frame(x, y))
+    expected = stats.pearsonr(x, y)
+    assert r == pytest.approx(expected.statistic, rel=1e-10)
+    assert p == pytest.approx(expected.pvalue, rel=1e-8)
+
+
+def test_compute_pearson_rejects_fewer_than_two_points():
+    with pytest.raises(ValueError):
+        Analyzer.compute_pearson(_xy_frame([1.0], [2.0]))
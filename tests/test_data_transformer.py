@@ -0,0 +1,44 @@
+# test_data_transformer.py
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from data_transformer import DataTransformer  # noqa: E402
+
+
+# Raw GDP strings on which the vectorized parser must agree with clean_gdp_cell
+PARITY_CASES = [
+    "27.7k", "81.5K", " 81.5K ", "27.7 k", "5380", "5,380", "1,234.5k",
+    "-3", "+4.5", "1e3", "2.5E-1", ".5k", "5.", "0", "",
+    "k", "K", "12k k", "1.2.3", "abc", "5kk", "1,2,3", None, np.nan,
+]
+
+# Inputs float() accepts that _parse_gdp_strings deliberately rejects
+REJECTED_CASES = ["inf", "nan", "1_000", "٣"]
+
+
+@pytest.mark.parametrize("raw", PARITY_CASES)
+def test_parse_gdp_strings_matches_clean_gdp_cell(raw):
+    expected = DataTransformer.clean_gdp_cell(raw)
+    (actual,) = DataTransformer._parse_gdp_strings([raw])
+    if np.isnan(expected):
+        assert np.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected)
+
+
+def test_parse_gdp_strings_vectorized_over_mixed_input():
+    parsed = DataTransformer._parse_gdp_strings(PARITY_CASES)
+    expected = np.array([DataTransformer.clean_gdp_cell(raw) for raw in PARITY_CASES])
+    np.testing.assert_allclose(parsed, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("raw", REJECTED_CASES)
+def test_parse_gdp_strings_rejects_non_plain_numbers(raw):
+    (actual,) = DataTransformer._parse_gdp_strings([raw])
+    assert np.isnan(actual)